@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Mapping
 
-from flask import Flask, render_template, request, url_for
+from flask import Flask, Response, jsonify, render_template, request, url_for
+from jinja2 import Template
 
-from monte_carlo import MonteCarloSpec, price_european_option
+from monte_carlo import MonteCarloSpec, price_european_strip
 
 app = Flask(__name__)
 
@@ -16,37 +18,121 @@ def _parse_float(value: str, name: str) -> float:
         raise ValueError(f"{name} must be a number") from exc
 
 
+def _to_int(value: str) -> int:
+    return int(float(value))
+
+
 def _parse_int(value: str, name: str) -> int:
     try:
-        number = int(float(value))
+        return _to_int(value)
     except ValueError as exc:
         raise ValueError(f"{name} must be an integer") from exc
-    return number
 
 
-def _build_spec(form: Dict[str, str]) -> MonteCarloSpec:
-    spot = _parse_float(form.get("spot", ""), "Spot")
-    maturity = _parse_float(form.get("maturity", ""), "Maturity")
-    rate = _parse_float(form.get("rate", ""), "Rate")
-    volatility = _parse_float(form.get("volatility", ""), "Volatility")
-    simulations = _parse_int(form.get("simulations", ""), "Simulations")
-    steps = _parse_int(form.get("steps", ""), "Steps")
-    seed_value = form.get("seed")
-    seed: int | None
-    if seed_value:
-        seed = _parse_int(seed_value, "Seed")
-    else:
-        seed = None
-
-    return MonteCarloSpec(
-        spot=spot,
-        maturity=maturity,
-        rate=rate,
-        volatility=volatility,
-        simulations=simulations,
-        steps=steps,
-        seed=seed,
+def _parse_strikes(value: str) -> tuple[float, ...]:
+    strikes = tuple(
+        _parse_float(part.strip(), "Strike") for part in value.split(",") if part.strip()
     )
+    if not strikes:
+        raise ValueError("Strike must be a number")
+    return strikes
+
+
+# (form field, caster, label, expected kind) for every required spec input
+_SPEC_FIELDS = (
+    ("spot", float, "Spot", "a number"),
+    ("maturity", float, "Maturity", "a number"),
+    ("rate", float, "Rate", "a number"),
+    ("volatility", float, "Volatility", "a number"),
+    ("simulations", _to_int, "Simulations", "an integer"),
+    ("steps", _to_int, "Steps", "an integer"),
+)
+
+
+def _build_spec(form: Mapping[str, str]) -> MonteCarloSpec:
+    values: Dict[str, Any] = {}
+    try:
+        for field, caster, label, kind in _SPEC_FIELDS:
+            values[field] = caster(form.get(field, ""))
+    except ValueError as exc:
+        # label and kind still refer to the field that failed to parse
+        raise ValueError(f"{label} must be {kind}") from exc
+
+    seed_value = form.get("seed")
+    seed = _parse_int(seed_value, "Seed") if seed_value else None
+
+    return MonteCarloSpec(**values, seed=seed, dtype=form.get("dtype") or "float64")
+
+
+def _price_strikes(
+    spec: MonteCarloSpec,
+    strikes: tuple[float, ...],
+    option_type: str,
+) -> tuple[float, ...]:
+    prices = price_european_strip(spec, strikes, option_type=option_type)
+    return tuple(float(price) for price in prices)
+
+
+_cached_price_strikes = lru_cache(maxsize=512)(_price_strikes)
+
+
+def _price(spec: MonteCarloSpec, strikes: tuple[float, ...], option_type: str) -> tuple[float, ...]:
+    # Unseeded runs draw fresh random numbers every time, so only seeded
+    # results are reproducible enough to cache.
+    if spec.seed is None:
+        return _price_strikes(spec, strikes, option_type)
+    return _cached_price_strikes(spec, strikes, option_type)
+
+
+_INDEX_TEMPLATE: Template | None = None
+
+
+def _index_template() -> Template:
+    # Resolve the template once instead of looking it up on every request,
+    # unless Jinja is set to pick up template edits (e.g. in debug mode).
+    global _INDEX_TEMPLATE
+    if app.jinja_env.auto_reload:
+        return app.jinja_env.get_template("index.html")
+    if _INDEX_TEMPLATE is None:
+        _INDEX_TEMPLATE = app.jinja_env.get_template("index.html")
+    return _INDEX_TEMPLATE
+
+
+def _render_index(defaults: Mapping[str, Any], result: Dict[str, Any] | None, error: str | None) -> str:
+    return render_template(_index_template(), defaults=defaults, result=result, error=error)
+
+
+def _price_form(form: Mapping[str, str]) -> Dict[str, Any]:
+    option_type = form.get("option_type", "call").lower()
+    strikes = _parse_strikes(form.get("strike", ""))
+    spec = _build_spec(form) 
+    prices = _price(spec, strikes, option_type)
+
+    return {
+        "price": prices[0],
+        "prices": list(zip(strikes, prices)),
+        "spot": spec.spot,
+        "strike": list(strikes),
+        "maturity": spec.maturity,
+        "rate": spec.rate,
+        "volatility": spec.volatility,
+        "steps": spec.steps,
+        "simulations": spec.simulations,
+        "option_type": option_type,
+        "seed": spec.seed,
+        "dtype": spec.dtype.name,
+    }
+
+
+def _json_form(payload: Mapping[str, Any]) -> Dict[str, str]:
+    form = {}
+    for key, value in payload.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        form[key] = str(value)
+    return form
 
 
 @app.route("/", methods=["GET"])
@@ -61,36 +147,39 @@ def index() -> str:
         "steps": 1,
         "option_type": "call",
         "seed": "",
+        "dtype": "float64",
     }
-    return render_template("index.html", defaults=default_values, result=None, error=None)
+    return _render_index(default_values, result=None, error=None)
 
 
 @app.route("/price", methods=["POST"])
 def price() -> str:
     form = request.form
     try:
-        option_type = form.get("option_type", "call").lower()
-        strike = _parse_float(form.get("strike", ""), "Strike")
-        spec = _build_spec(form) 
-        price_value = price_european_option(spec, strike=strike, option_type=option_type)
+        result = _price_form(form)
     except Exception as exc:  # noqa: BLE001
         default_values = {**form}
-        return render_template("index.html", defaults=default_values, result=None, error=str(exc)), 400
+        return _render_index(default_values, result=None, error=str(exc)), 400
 
-    result = {
-        "price": price_value,
-        "spot": spec.spot,
-        "strike": strike,
-        "maturity": spec.maturity,
-        "rate": spec.rate,
-        "volatility": spec.volatility,
-        "steps": spec.steps,
-        "simulations": spec.simulations,
-        "option_type": option_type,
-        "seed": spec.seed,
-    }
+    return _render_index(form, result=result, error=None)
+
+
+@app.route("/price.json", methods=["POST"])
+def price_json() -> Response:
+    """Same as ``/price`` but returns the result as JSON without rendering.
+
+    Accepts either form data or a JSON object with the same fields; ``strike``
+    may be a list of strikes in JSON.
+    """
+
+    payload = request.get_json(silent=True)
+    form = _json_form(payload) if isinstance(payload, dict) else request.form
+    try:
+        result = _price_form(form)
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": str(exc)}), 400
 
-    return render_template("index.html", defaults=form, result=result, error=None)
+    return jsonify(result)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ Simple implementation of the Cox-Ross-Rubinstein binomial option pricing model.
 
 Supports European and American call/put options.  The implementation exposes a
 convenient dataclass for capturing option parameters and a pricing function that
-performs backward induction on the binomial tree.
+performs backward induction on the binomial tree, one NumPy array per time step.
 """
 from __future__ import annotations
 
@@ -11,6 +11,8 @@ import math
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+
 OptionType = Literal["call", "put"]
 ExerciseType = Literal["european", "american"]
 
@@ -51,6 +53,11 @@ def payoff(price: float, strike: float, option_type: OptionType) -> float:
     return max(strike - price, 0.0)
 
 
+def _payoff_array(prices: np.ndarray, strike: float, option_type: OptionType) -> np.ndarray:
+    values = prices - strike if option_type == "call" else strike - prices
+    return np.maximum(values, 0.0, out=values)
+
+
 def binomial_price(spec: OptionSpec) -> float:
     """Price an option using the CRR binomial model.
 
@@ -71,26 +78,23 @@ def binomial_price(spec: OptionSpec) -> float:
     if not 0.0 < p < 1.0:
         raise ValueError("Risk-neutral probability is outside (0, 1). Check inputs.")
 
-    # Terminal node payoffs
-    values = [
-        payoff(spec.spot * (u ** j) * (d ** (spec.steps - j)), spec.strike, spec.option_type)
-        for j in range(spec.steps + 1)
-    ]
+    # Power tables shared by every node: u_pow[k] == u ** k, d_pow[k] == d ** k
+    moves = np.arange(spec.steps + 1)
+    u_pow = u ** moves
+    d_pow = d ** moves
+
+    # Terminal node payoffs, indexed by the number of up moves
+    terminal_prices = spec.spot * u_pow * d_pow[::-1]
+    values = _payoff_array(terminal_prices, spec.strike, spec.option_type)
 
     # Roll back through the tree
     for step in range(spec.steps - 1, -1, -1):
-        next_values = []
-        for up_moves in range(step + 1):
-            continuation = disc * (p * values[up_moves + 1] + (1 - p) * values[up_moves])
-            if spec.exercise == "american":
-                price_at_node = spec.spot * (u ** up_moves) * (d ** (step - up_moves))
-                exercise_value = payoff(price_at_node, spec.strike, spec.option_type)
-                next_values.append(max(continuation, exercise_value))
-            else:
-                next_values.append(continuation)
-        values = next_values
-
-    return values[0]
+        values = disc * (p * values[1:] + (1 - p) * values[:-1])
+        if spec.exercise == "american":
+            node_prices = spec.spot * u_pow[: step + 1] * d_pow[step::-1]
+            values = np.maximum(values, _payoff_array(node_prices, spec.strike, spec.option_type))
+
+    return float(values[0])
 
 
 def example() -> None:
@@ -0,0 +1,53 @@
+"""
+Closed-form Black-Scholes prices for European call and put options.
+
+The functions use only the standard library and serve as analytic benchmarks
+for the binomial and Monte Carlo pricers.
+"""
+from __future__ import annotations
+
+import math
+
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def _d1_d2(spot: float, strike: float, rate: float, volatility: float, maturity: float) -> tuple[float, float]:
+    if spot <= 0:
+        raise ValueError("Spot must be positive")
+    if strike <= 0:
+        raise ValueError("Strike must be positive")
+    if volatility <= 0:
+        raise ValueError("Volatility must be positive")
+    if maturity <= 0:
+        raise ValueError("Maturity must be positive")
+
+    vol_sqrt_t = volatility * math.sqrt(maturity)
+    d1 = (math.log(spot / strike) + (rate + 0.5 * volatility ** 2) * maturity) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+
+def bs_call(spot: float, strike: float, rate: float, volatility: float, maturity: float) -> float:
+    """Black-Scholes price of a European call option."""
+
+    d1, d2 = _d1_d2(spot, strike, rate, volatility, maturity)
+    return spot * _norm_cdf(d1) - strike * math.exp(-rate * maturity) * _norm_cdf(d2)
+
+
+def bs_put(spot: float, strike: float, rate: float, volatility: float, maturity: float) -> float:
+    """Black-Scholes price of a European put option."""
+
+    d1, d2 = _d1_d2(spot, strike, rate, volatility, maturity)
+    return strike * math.exp(-rate * maturity) * _norm_cdf(-d2) - spot * _norm_cdf(-d1)
+
+
+def example() -> None:
+    call_price = bs_call(100, 100, 0.05, 0.2, 1.0)
+    put_price = bs_put(100, 100, 0.05, 0.2, 1.0)
+    print(f"European call (Black-Scholes): {call_price:.4f}")
+    print(f"European put  (Black-Scholes): {put_price:.4f}")
+
+
+if __name__ == "__main__":
+    example()
@@ -0,0 +1,25 @@
+"""
+Ahead-of-time compile the Monte Carlo kernels into the ``mc_kernels`` extension.
+
+Run ``python build_mc_ext.py`` once per target platform (requires Numba and a C
+compiler). The resulting shared library is placed next to this file, and
+``monte_carlo`` imports it in preference to the JIT kernels of
+``monte_carlo_numba``, so no compilation happens when a web worker starts.
+AOT-compiled kernels run on a single thread.
+"""
+from __future__ import annotations
+
+import os
+
+from numba.pycc import CC
+
+from monte_carlo_numba import asian_call_kernel, up_and_out_call_kernel
+
+cc = CC("mc_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("mc_asian_call", "f8(f8, f8, f8, f8, f8, i8, i8, i8[:])")(asian_call_kernel)
+cc.export("mc_up_and_out_call", "f8(f8, f8, f8, f8, f8, f8, i8, i8, i8[:])")(up_and_out_call_kernel)
+
+
+if __name__ == "__main__":
+    cc.compile()
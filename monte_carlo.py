@@ -1,24 +1,92 @@
 """
 Monte Carlo simulation for pricing options with custom payoff functions.
 
-The module provides a small, dependency-free implementation that can price
+The module provides a small NumPy-based implementation that can price
 options under a geometric Brownian motion model. Users supply a payoff
 function that consumes the simulated path, enabling payoffs that depend on
-terminal or path-dependent values.
+terminal or path-dependent values. Payoffs that only depend on the terminal
+price can instead be supplied as a vectorized function of all terminal prices.
+
+When Numba is installed, the Asian and barrier payoff factories are priced by
+compiled kernels from ``monte_carlo_numba`` that never materialize the paths.
+If the ahead-of-time ``mc_kernels`` extension built by ``build_mc_ext.py`` is
+present, it is used instead and no JIT compilation takes place.
 """
 from __future__ import annotations
 
 import math
-import random
-from dataclasses import dataclass
-from typing import Callable, Sequence
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property
+from itertools import repeat
+from typing import Callable, Iterator, Sequence
 
 import argparse
 
+import numpy as np
+
+try:
+    import mc_kernels as compiled_kernels
+except ImportError:  # Only present after running build_mc_ext.py
+    try:
+        import monte_carlo_numba as compiled_kernels
+    except ImportError:  # Numba is an optional dependency
+        compiled_kernels = None
+
+try:
+    from scipy.special import ndtri
+    from scipy.stats import qmc as scipy_qmc
+except ImportError:  # SciPy is only needed for quasi-Monte Carlo
+    scipy_qmc = None
+
+#: Highest dimension supported by SciPy's Sobol' direction numbers.
+MAX_SOBOL_DIMENSION = 21201
+
+#: Number of independently seeded blocks the compiled kernels split their
+#: simulations into. It is fixed so that prices do not depend on thread count.
+KERNEL_BLOCKS = 64
+
+#: Approximate number of normal draws held in memory at once by
+#: ``monte_carlo_price``; simulations are streamed in chunks of this size.
+CHUNK_ELEMENTS = 2**20
+
+#: Number of normal draws above which ``monte_carlo_price`` spreads the
+#: simulations over worker processes when ``MonteCarloSpec.parallel`` is None.
+PARALLEL_THRESHOLD = 10**6
+
+#: Number of independently seeded sub-jobs a parallel run is split into. It is
+#: fixed so that prices do not depend on how many CPUs are available.
+PARALLEL_JOBS = 64
+
 
 @dataclass(frozen=True)
 class MonteCarloSpec:
-    """Inputs required to run a Monte Carlo option pricing simulation."""
+    """Inputs required to run a Monte Carlo option pricing simulation.
+
+    With ``antithetic`` enabled, every normal draw is paired with its negation,
+    which reduces the variance of smooth payoffs. The number of simulated paths
+    is then rounded up to an even number.
+
+    With ``qmc`` enabled, normals are obtained from a scrambled Sobol' sequence
+    (one dimension per time step) instead of pseudo-random draws. This
+    requires SciPy, and ``simulations`` should be a power of two (twice a
+    power of two with antithetic variates) to keep the sequence balanced.
+
+    ``parallel`` controls whether ``monte_carlo_price`` splits the simulations
+    into ``PARALLEL_JOBS`` sub-jobs run on one process per CPU. ``None``
+    enables it automatically for jobs larger than ``PARALLEL_THRESHOLD`` draws
+    whose payoff function can be pickled. Each sub-job is seeded from
+    ``seed``, so parallel runs are reproducible on any machine, but differ
+    from serial runs.
+    Quasi-Monte Carlo runs are never split.
+
+    ``dtype`` selects the floating-point precision of the simulated normals
+    and paths. ``np.float32`` halves memory traffic and is ample for
+    interactive use; payoffs are always accumulated in double precision. The
+    compiled Numba kernels always simulate in double precision.
+    """
 
     spot: float
     maturity: float
@@ -27,8 +95,21 @@ class MonteCarloSpec:
     simulations: int = 10_000
     steps: int = 1
     seed: int | None = None
+    antithetic: bool = True
+    qmc: bool = False
+    parallel: bool | None = None
+    dtype: np.dtype = np.dtype(np.float64)
 
     def __post_init__(self) -> None:
+        # Normalize aliases such as np.float32 or "float32" so that equal
+        # precisions compare and hash equal.
+        try:
+            dtype = np.dtype(self.dtype)
+        except TypeError as exc:
+            raise ValueError("dtype must be float32 or float64") from exc
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64")
+        object.__setattr__(self, "dtype", dtype)
         if self.spot <= 0:
             raise ValueError("Spot must be positive")
         if self.maturity <= 0:
@@ -39,60 +120,405 @@ class MonteCarloSpec:
             raise ValueError("Number of simulations must be positive")
         if self.steps <= 0:
             raise ValueError("Number of time steps must be positive")
+        if self.seed is not None and self.seed < 0:
+            raise ValueError("Seed must be non-negative")
+        if self.qmc and self.steps > MAX_SOBOL_DIMENSION:
+            raise ValueError(
+                f"Quasi-Monte Carlo supports at most {MAX_SOBOL_DIMENSION} time steps"
+            )
+
+    @property
+    def num_paths(self) -> int:
+        """Number of simulated paths, accounting for antithetic pairing."""
+
+        if self.antithetic:
+            return self.simulations + self.simulations % 2
+        return self.simulations
+
+    # cached_property stores its value in the instance __dict__, which
+    # bypasses the frozen __setattr__ and is ignored by __eq__ and __hash__.
+
+    @cached_property
+    def drift_per_step(self) -> float:
+        """Risk-neutral drift of the log-price over one time step."""
+
+        return (self.rate - 0.5 * self.volatility ** 2) * self.maturity / self.steps
+
+    @cached_property
+    def diffusion_per_step(self) -> float:
+        """Standard deviation of the log-price increment over one time step."""
+
+        return self.volatility * math.sqrt(self.maturity / self.steps)
+
+    @cached_property
+    def discount_factor(self) -> float:
+        """Risk-free discount factor from maturity back to today."""
+
+        return math.exp(-self.rate * self.maturity)
+
+
+PayoffKernel = Callable[[MonteCarloSpec], float]
+
+
+def register_payoff_kernel(payoff_fn: Callable[..., float], kernel: PayoffKernel) -> None:
+    """Route ``monte_carlo_price`` calls for ``payoff_fn`` to ``kernel``.
+
+    The kernel receives the simulation spec and returns the discounted price
+    directly. It is stored as the ``mc_kernel`` attribute of ``payoff_fn``, so
+    the payoff must be an object that accepts attributes, such as a function.
+    The tag records ``payoff_fn`` itself, so wrappers that copy its
+    ``__dict__`` (for example via ``functools.wraps``) do not inherit the
+    kernel.
+    """
+
+    payoff_fn.mc_kernel = (payoff_fn, kernel)
+
+
+def _registered_kernel(payoff_fn: Callable[..., float]) -> PayoffKernel | None:
+    tag = getattr(payoff_fn, "mc_kernel", None)
+    if isinstance(tag, tuple) and len(tag) == 2 and tag[0] is payoff_fn:
+        return tag[1]
+    return None
+
+
+def _make_rng(seed: int | np.random.SeedSequence | None) -> np.random.Generator:
+    """Return the generator used for all NumPy simulations.
+
+    SFC64 is a faster bit generator than the default PCG64 and is more than
+    adequate for Monte Carlo pricing.
+    """
+
+    return np.random.Generator(np.random.SFC64(seed))
+
+
+def _normal_chunks(
+    rng: np.random.Generator,
+    spec: MonteCarloSpec,
+    steps: int,
+    chunk_size: int,
+) -> Iterator[np.ndarray]:
+    """Yield standard normals for ``spec.num_paths`` paths, ``chunk_size`` rows at a time.
+
+    Antithetic pairs are always kept within the same chunk, and the Sobol'
+    engine carries on across chunks, so streaming does not change which
+    points are drawn. Every chunk is a fresh array that callers may
+    overwrite.
+    """
+
+    count = spec.num_paths // 2 if spec.antithetic else spec.num_paths
+    block = max(1, chunk_size // 2) if spec.antithetic else chunk_size
+    engine = None
+    if spec.qmc:
+        if scipy_qmc is None:
+            raise ImportError("Quasi-Monte Carlo pricing requires SciPy")
+        engine = scipy_qmc.Sobol(d=steps, scramble=True, seed=rng)
+
+    for start in range(0, count, block):
+        n = min(block, count - start)
+        if engine is not None:
+            normals = ndtri(engine.random(n)).astype(spec.dtype, copy=False)
+        else:
+            normals = rng.standard_normal((n, steps), dtype=spec.dtype)
+
+        if spec.antithetic:
+            yield np.concatenate([normals, -normals], axis=0)
+        else:
+            yield normals
+
+
+def _chunk_size(steps: int) -> int:
+    # Powers of two keep every chunk of a Sobol' sequence balanced.
+    rows = max(1, CHUNK_ELEMENTS // steps)
+    return 1 << (rows.bit_length() - 1)
+
+
+def _to_log_increments(z: np.ndarray, drift: float, diffusion: float) -> np.ndarray:
+    """Turn standard normals into log-price increments in place."""
+
+    np.multiply(z, diffusion, out=z)
+    np.add(z, drift, out=z)
+    return z
+
+
+def _kernel_seeds(spec: MonteCarloSpec) -> np.ndarray:
+    """Independent 32-bit seeds, one per block of a compiled kernel."""
+
+    state = np.random.SeedSequence(spec.seed).generate_state(KERNEL_BLOCKS)
+    return state.astype(np.int64)
+
+
+def _payoff_total(
+    spec: MonteCarloSpec,
+    seed: int | np.random.SeedSequence | None,
+    payoff_fn: Callable[[Sequence[float]], float] | None,
+    terminal_payoff_fn: Callable[[np.ndarray], np.ndarray] | None,
+    paths_payoff_fn: Callable[[np.ndarray], np.ndarray] | None,
+) -> float:
+    """Simulate ``spec.num_paths`` paths and return the sum of their payoffs."""
+
+    rng = _make_rng(seed)
+    drift = spec.drift_per_step
+    diffusion = spec.diffusion_per_step
+
+    # One chunk-sized path buffer is refilled for every chunk instead of
+    # materializing all paths at once. The first chunk is the largest.
+    paths_buf: np.ndarray | None = None
+
+    total_payoff = 0.0
+    for z in _normal_chunks(rng, spec, spec.steps, _chunk_size(spec.steps)):
+        log_paths = _to_log_increments(z, drift, diffusion)
+
+        if terminal_payoff_fn is not None:
+            if spec.steps == 1:
+                log_terminal = log_paths[:, 0]
+            else:
+                log_terminal = log_paths.sum(axis=1)
+            terminal_prices = np.exp(log_terminal, out=log_terminal)
+            terminal_prices *= spec.spot
+            total_payoff += float(np.sum(terminal_payoff_fn(terminal_prices), dtype=np.float64))
+            continue
+
+        np.cumsum(log_paths, axis=1, out=log_paths)
+
+        if paths_buf is None:
+            paths_buf = np.empty((len(log_paths), spec.steps + 1), dtype=spec.dtype)
+            paths_buf[:, 0] = spec.spot
+        paths = paths_buf[: len(log_paths)]
+        np.exp(log_paths, out=paths[:, 1:])
+        paths[:, 1:] *= spec.spot
+
+        if paths_payoff_fn is not None:
+            total_payoff += float(np.sum(paths_payoff_fn(paths), dtype=np.float64))
+        else:
+            for path in paths:
+                total_payoff += float(payoff_fn(path))
+
+    return total_payoff
+
+
+def _is_picklable(obj: object) -> bool:
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _run_in_parallel(spec: MonteCarloSpec, payoff_fns: Sequence[Callable | None]) -> bool:
+    # Splitting a Sobol' run into separately scrambled, unbalanced point sets
+    # throws away its accuracy, so quasi-Monte Carlo always runs serially.
+    if spec.qmc:
+        return False
+    if spec.parallel is not None:
+        return spec.parallel
+    # Process start-up only pays off for large jobs, and closures or lambdas
+    # cannot be sent to worker processes.
+    if spec.simulations * spec.steps <= PARALLEL_THRESHOLD:
+        return False
+    return all(_is_picklable(fn) for fn in payoff_fns if fn is not None)
+
+
+def _parallel_payoff_total(
+    spec: MonteCarloSpec,
+    payoff_fns: Sequence[Callable | None],
+) -> tuple[float, int]:
+    """Split the simulations into ``PARALLEL_JOBS`` sub-jobs over worker processes.
+
+    The split and the sub-job seeds do not depend on the number of workers.
+    Returns the summed payoff and the number of simulated paths.
+    """
 
+    sizes = [
+        spec.simulations // PARALLEL_JOBS + (index < spec.simulations % PARALLEL_JOBS)
+        for index in range(PARALLEL_JOBS)
+    ]
+    sub_specs = [replace(spec, simulations=size, parallel=False) for size in sizes if size > 0]
+    seeds = np.random.SeedSequence(spec.seed).spawn(len(sub_specs))
+    args = (sub_specs, seeds, *(repeat(fn) for fn in payoff_fns))
+
+    workers = min(os.cpu_count() or 1, len(sub_specs))
+    if workers == 1:
+        total_payoff = sum(map(_payoff_total, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            total_payoff = sum(pool.map(_payoff_total, *args))
 
-def monte_carlo_price(spec: MonteCarloSpec, payoff_fn: Callable[[Sequence[float]], float]) -> float:
+    return total_payoff, sum(sub_spec.num_paths for sub_spec in sub_specs)
+
+
+def monte_carlo_price(
+    spec: MonteCarloSpec,
+    payoff_fn: Callable[[Sequence[float]], float] | None = None,
+    terminal_payoff_fn: Callable[[np.ndarray], np.ndarray] | None = None,
+    paths_payoff_fn: Callable[[np.ndarray], np.ndarray] | None = None,
+) -> float:
     """Price an option via Monte Carlo simulation with a custom payoff.
 
     The simulated asset follows a geometric Brownian motion discretized into
     ``steps`` equal intervals. The payoff function receives the full simulated
     path, so users can express vanilla or path-dependent payoffs.
 
+    Simulations are generated, evaluated and discarded in chunks of about
+    ``CHUNK_ELEMENTS`` normal draws, so memory use does not grow with
+    ``simulations``.
+
+    Payoff functions with a registered kernel (see
+    ``register_payoff_kernel``) are priced by that kernel instead, unless
+    ``spec.qmc`` is set.
+
     Args:
         spec: Simulation parameters.
         payoff_fn: Callable that accepts the simulated price path (including
-            the initial price) and returns the payoff for that path.
+            the initial price) and returns the payoff for that path. The path
+            is a view into a NumPy buffer that is overwritten for the next
+            chunk, so the callable must copy it if it needs to keep it.
+        terminal_payoff_fn: Vectorized alternative to ``payoff_fn`` for
+            payoffs that only depend on the terminal price. It receives an
+            array with the terminal prices of a chunk of simulations and
+            returns the array of payoffs.
+        paths_payoff_fn: Vectorized alternative to ``payoff_fn`` that receives
+            an ``(n, steps + 1)`` array holding a chunk of simulated paths and
+            returns the ``n`` payoffs. The array is reused for the next chunk.
 
     Returns:
         Present value of the expected payoff under the risk-neutral measure.
     """
 
-    rng = random.Random(spec.seed)
-    dt = spec.maturity / spec.steps
-    drift = (spec.rate - 0.5 * spec.volatility ** 2) * dt
-    diffusion = spec.volatility * math.sqrt(dt)
+    payoff_fns = (payoff_fn, terminal_payoff_fn, paths_payoff_fn)
+    if sum(fn is not None for fn in payoff_fns) != 1:
+        raise ValueError(
+            "Provide exactly one of payoff_fn, terminal_payoff_fn or paths_payoff_fn"
+        )
+
+    # Compiled kernels only draw pseudo-random normals, so quasi-Monte Carlo
+    # runs always use the NumPy Sobol' path.
+    if payoff_fn is not None and not spec.qmc:
+        kernel = _registered_kernel(payoff_fn)
+        if kernel is not None:
+            return kernel(spec)
+
+    if _run_in_parallel(spec, payoff_fns):
+        total_payoff, num_paths = _parallel_payoff_total(spec, payoff_fns)
+    else:
+        total_payoff = _payoff_total(spec, spec.seed, *payoff_fns)
+        num_paths = spec.num_paths
 
-    total_payoff = 0.0
-    for _ in range(spec.simulations):
-        price = spec.spot
-        path = [price]
-        for _ in range(spec.steps):
-            z = rng.gauss(0.0, 1.0)
-            price *= math.exp(drift + diffusion * z)
-            path.append(price)
-        total_payoff += payoff_fn(path)
+    expected_payoff = total_payoff / num_paths
 
-    expected_payoff = total_payoff / spec.simulations
-    discount_factor = math.exp(-spec.rate * spec.maturity)
-    return discount_factor * expected_payoff
+    return spec.discount_factor * expected_payoff
 
 
 def price_european_option(
     spec: MonteCarloSpec,
     strike: float,
     option_type: str = "call",
+    control_variate: bool = True,
 ) -> float:
-    """Convenience helper to price a European call or put via Monte Carlo."""
+    """Convenience helper to price a European call or put via Monte Carlo.
+
+    Vanilla European payoffs only depend on the terminal price, which is
+    sampled exactly under geometric Brownian motion in a single step, so
+    ``spec.steps`` does not affect the result.
+
+    With ``control_variate`` enabled, the terminal price itself, whose
+    risk-neutral mean ``spot * exp(rate * maturity)`` is known exactly, is used
+    as a control variate with the variance-minimizing coefficient estimated
+    from the same sample.
+    """
+
+    prices = price_european_strip(
+        spec,
+        [strike],
+        option_type=option_type,
+        control_variate=control_variate,
+    )
+    return float(prices[0])
+
+
+def price_european_strip(
+    spec: MonteCarloSpec,
+    strikes: Sequence[float] | np.ndarray,
+    option_type: str = "call",
+    control_variate: bool = True,
+) -> np.ndarray:
+    """Price European calls or puts for several strikes on the same simulation.
+
+    The terminal prices are drawn once and shared by every strike, so pricing a
+    whole strip costs little more than a single option. See
+    ``price_european_option`` for the simulation and control variate details.
+
+    Returns:
+        Array with the present value of the option for each strike.
+    """
 
     option_type = option_type.lower()
-    if option_type == "call":
-        payoff_fn = european_call_payoff(strike)
-    elif option_type == "put":
-        payoff_fn = european_put_payoff(strike)
-    else:
+    if option_type not in ("call", "put"):
         raise ValueError("option_type must be 'call' or 'put'")
+    strikes = np.asarray(strikes, dtype=np.float64)
+    if strikes.ndim != 1 or strikes.size == 0:
+        raise ValueError("Strikes must be a non-empty one-dimensional sequence")
+    if np.any(strikes <= 0):
+        raise ValueError("Strike must be positive")
 
-    return monte_carlo_price(spec, payoff_fn)
+    rng = _make_rng(spec.seed)
+    drift = (spec.rate - 0.5 * spec.volatility ** 2) * spec.maturity
+    diffusion = spec.volatility * math.sqrt(spec.maturity)
+    forward = spec.spot * math.exp(spec.rate * spec.maturity)
+    sim_strikes = strikes.astype(spec.dtype, copy=False)
+
+    # Simulations are streamed in chunks of at most CHUNK_ELEMENTS payoffs.
+    # Only running sums are kept: of the payoffs and, for the control
+    # variate, of the terminal price deviation from the forward, its square
+    # and its product with the payoffs.
+    count = 0
+    sum_payoffs = np.zeros(strikes.size)
+    sum_controls = 0.0
+    sum_controls_sq = 0.0
+    sum_cross = np.zeros(strikes.size)
+    for z in _normal_chunks(rng, spec, 1, _chunk_size(strikes.size)):
+        terminal_prices = np.exp(_to_log_increments(z, drift, diffusion), out=z)[:, 0]
+        terminal_prices *= spec.spot
+
+        # One column of payoffs per strike, floored at zero in place
+        if option_type == "call":
+            payoffs = terminal_prices[:, None] - sim_strikes[None, :]
+        else:
+            payoffs = sim_strikes[None, :] - terminal_prices[:, None]
+        np.maximum(payoffs, 0.0, out=payoffs)
+
+        if not control_variate:
+            count += len(payoffs)
+            sum_payoffs += payoffs.sum(axis=0, dtype=np.float64)
+            continue
+
+        controls = terminal_prices
+        samples = payoffs
+        if spec.antithetic:
+            # Antithetic pairs, not individual paths, are the independent
+            # samples, so the coefficient is fitted on pair averages. Pairs
+            # never straddle chunks.
+            half = len(payoffs) // 2
+            controls = 0.5 * (terminal_prices[:half] + terminal_prices[half:])
+            samples = 0.5 * (payoffs[:half] + payoffs[half:])
+        deviations = controls.astype(np.float64) - forward
+
+        count += len(samples)
+        sum_payoffs += samples.sum(axis=0, dtype=np.float64)
+        sum_controls += float(deviations.sum())
+        sum_controls_sq += float(deviations @ deviations)
+        sum_cross += deviations @ samples
+
+    expected_payoffs = sum_payoffs / count
+    if control_variate:
+        # The deviations have a known mean of zero under the risk-neutral
+        # measure, so the estimate is corrected by their sample mean.
+        mean_control = sum_controls / count
+        variance = sum_controls_sq - count * mean_control ** 2
+        if variance > 0.0:
+            betas = (sum_cross - count * mean_control * expected_payoffs) / variance
+            expected_payoffs = expected_payoffs - betas * mean_control
+
+    return spec.discount_factor * expected_payoffs
 
 
 def european_call_payoff(strike: float) -> Callable[[Sequence[float]], float]:
@@ -121,6 +547,70 @@ def european_put_payoff(strike: float) -> Callable[[Sequence[float]], float]:
     return _payoff
 
 
+def asian_call_payoff(strike: float) -> Callable[[Sequence[float]], float]:
+    """Factory for an arithmetic-average Asian call over the full path."""
+
+    if strike <= 0:
+        raise ValueError("Strike must be positive")
+
+    def _payoff(path: Sequence[float]) -> float:
+        average_price = sum(path) / len(path)
+        return max(average_price - strike, 0.0)
+
+    if compiled_kernels is not None:
+        register_payoff_kernel(
+            _payoff,
+            lambda spec: compiled_kernels.mc_asian_call(
+                spec.spot,
+                strike,
+                spec.rate,
+                spec.volatility,
+                spec.maturity,
+                spec.simulations,
+                spec.steps,
+                _kernel_seeds(spec),
+            ),
+        )
+
+    return _payoff
+
+
+def up_and_out_call_payoff(strike: float, barrier: float) -> Callable[[Sequence[float]], float]:
+    """Factory for a discretely monitored up-and-out call.
+
+    The option pays a European call on the terminal price unless any price on
+    the path reaches ``barrier``.
+    """
+
+    if strike <= 0:
+        raise ValueError("Strike must be positive")
+    if barrier <= 0:
+        raise ValueError("Barrier must be positive")
+
+    def _payoff(path: Sequence[float]) -> float:
+        if max(path) >= barrier:
+            return 0.0
+        return max(path[-1] - strike, 0.0)
+
+    if compiled_kernels is not None:
+        register_payoff_kernel(
+            _payoff,
+            lambda spec: compiled_kernels.mc_up_and_out_call(
+                spec.spot,
+                strike,
+                barrier,
+                spec.rate,
+                spec.volatility,
+                spec.maturity,
+                spec.simulations,
+                spec.steps,
+                _kernel_seeds(spec),
+            ),
+        )
+
+    return _payoff
+
+
 def example() -> None:
     spec = MonteCarloSpec(
         spot=100,
@@ -135,12 +625,8 @@ def example() -> None:
     call_price = monte_carlo_price(spec, european_call_payoff(strike=100))
     put_price = monte_carlo_price(spec, european_put_payoff(strike=100))
 
-    # Example of a custom payoff: an average-price Asian call
-    def asian_call(path: Sequence[float]) -> float:
-        average_price = sum(path) / len(path)
-        return max(average_price - 100, 0.0)
-
-    asian_price = monte_carlo_price(spec, asian_call)
+    # Example of a path-dependent payoff: an average-price Asian call
+    asian_price = monte_carlo_price(spec, asian_call_payoff(strike=100))
 
     print(f"European call (MC): {call_price:.4f}")
     print(f"European put  (MC): {put_price:.4f}")
@@ -180,6 +666,25 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Optional RNG seed for reproducible prices",
     )
+    parser.add_argument(
+        "--no-antithetic",
+        dest="antithetic",
+        action="store_false",
+        help="Disable antithetic variates",
+    )
+    parser.add_argument(
+        "--float32",
+        dest="dtype",
+        action="store_const",
+        const=np.float32,
+        default=np.float64,
+        help="Simulate in single precision for faster, slightly less accurate prices",
+    )
+    parser.add_argument(
+        "--qmc",
+        action="store_true",
+        help="Use scrambled Sobol' normals instead of pseudo-random draws (requires SciPy)",
+    )
 
     return parser.parse_args(argv)
 
@@ -194,6 +699,9 @@ def main(argv: Sequence[str] | None = None) -> None:
         simulations=args.simulations,
         steps=args.steps,
         seed=args.seed,
+        antithetic=args.antithetic,
+        qmc=args.qmc,
+        dtype=args.dtype,
     )
     price = price_european_option(spec, strike=args.strike, option_type=args.option_type)
 